@@ -101,7 +101,8 @@ class MainBackend(QObject):
 
         self.tracks.addTrack.connect(self.addTrack)
         self.waveformBuffer.returnWaveform.connect(self.tracks.slo_addWaveform)
-        self.tracks.getWaveform.connect(self.waveformBuffer.getWaveform)
+        # Queued to look up or create render jobs after the current input or paint event has been handled
+        self.tracks.getWaveform.connect(self.waveformBuffer.getWaveform, Qt.QueuedConnection)
         self.tracks.deleteChannel.connect(self.deleteChannel)
 
         self.tracks.setPlayerPosition.connect(self.audioplayer.setPos)
@@ -17,9 +17,10 @@
 class Waveform:
     """
     Merely a data structure to simplify the handling of waveforms. This class contains space for sample data,
-    which might be rendered by the WaveformThread to a cooridnate-list, which then can be sent to a TrackWaveform object
-    to be painted and display to the user. It also contains information about the channel it belongs to and its position
-    and size on the timeline.
+    which might be rendered by the WaveformThread to a cooridnate-list and painted to images, which then can be sent to
+    a TrackWaveform object to be displayed to the user. The images may be dropped again by the WaveformBufferChannel to
+    limit memory usage. It also contains information about the channel it belongs to and its position and size on the
+    timeline.
     """
 
     def __init__(self, channel, startBlock, dataBlocks, numberOfPixmaps, dataSrc):
@@ -34,4 +35,5 @@ class Waveform:
         self.height = 100
 
         self.pointsMax = None
-        self.pointsRMS = None
\ No newline at end of file
+        self.pointsRMS = None
+        self.images = None
\ No newline at end of file
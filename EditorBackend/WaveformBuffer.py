@@ -58,8 +58,9 @@ class WaveformBuffer(QObject):
         self.waveformBufferChannels = dict()
 
         self.waveformThread = WaveformThread(self.sampleWidth, self.blockSize, self.mutex)
-        self.waveformThread.finishedWaveform.connect(self.addWaveform)
-        self.waveformThread.updateMsg.connect(self.formatWaveformMessage)
+        # Emitted from the render thread, always queue to the GUI thread
+        self.waveformThread.finishedWaveform.connect(self.addWaveform, Qt.QueuedConnection)
+        self.waveformThread.updateMsg.connect(self.formatWaveformMessage, Qt.QueuedConnection)
         self.waveformThread.start()
 
     def addChannel(self, channel):
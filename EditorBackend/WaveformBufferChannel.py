@@ -14,7 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from PyQt5.Qt import *
 
 from EditorBackend.Waveform import Waveform
@@ -31,6 +31,9 @@ class WaveformBufferChannel(QObject):
     returnWaveform = pyqtSignal(Waveform)
     updateWaveformMessage = pyqtSignal(int, int)
 
+    # Maximum number of painted images kept per channel, about 50 MB of 1000x100 ARGB32 images
+    MAX_IMAGES = 128
+
     def __init__(self, buffer, sampleWidth, blockSize, waveformHeight, channel, mutex, thread):
         """
         New: Manages the waveforms for one channel and feed waveform-requests, if necessary to the thread. Initialise
@@ -56,6 +59,9 @@ class WaveformBufferChannel(QObject):
         # 2D-Dictionary to store waveforms [block number]x[width]
         self.waveforms = defaultdict(lambda: defaultdict(dict))
         self.isRendered = defaultdict(lambda: defaultdict(dict))
+        # Rendered waveforms that still hold their images, least recently used first, see cacheImages
+        self.imageCache = OrderedDict()
+        self.imageCount = 0
 
         # outsource rendering to thread to keep UI responsive
         self.waveformThread = thread
@@ -75,7 +81,13 @@ class WaveformBufferChannel(QObject):
             if self.isRendered[startBlock][dataBlocks][numberOfPixmaps]:
                 # Has already been calculated, immediately return
                 waveform = self.waveforms[startBlock][dataBlocks][numberOfPixmaps]
-                self.returnWaveform.emit(waveform)
+                if waveform.images is None:
+                    # The images have been dropped, paint them again from the points lists
+                    self.isRendered[startBlock][dataBlocks][numberOfPixmaps] = False
+                    self.waveformThread.add(waveform)
+                else:
+                    self.cacheImages(waveform)
+                    self.returnWaveform.emit(waveform)
 
             else:
                 # Already in queue
@@ -106,4 +118,24 @@ class WaveformBufferChannel(QObject):
         if not waveform.memoryError:
             self.isRendered[waveform.startBlock][waveform.dataBlocks][waveform.numberOfPixmaps] = True
             self.waveforms[waveform.startBlock][waveform.dataBlocks][waveform.numberOfPixmaps] = waveform
-            self.returnWaveform.emit(waveform)
\ No newline at end of file
+            self.cacheImages(waveform)
+            self.returnWaveform.emit(waveform)
+
+    def cacheImages(self, waveform):
+        """
+        Marks the images of a waveform as used last. Only the points lists of all rendered waveforms are kept, the
+        images of the least recently used waveforms are dropped once there are more than MAX_IMAGES of them.
+
+        :param waveform: A rendered waveform-object holding its images.
+        """
+        key = (waveform.startBlock, waveform.dataBlocks, waveform.numberOfPixmaps)
+        if key in self.imageCache:
+            self.imageCache.move_to_end(key)
+            return
+
+        self.imageCache[key] = waveform
+        self.imageCount += waveform.numberOfPixmaps
+        while self.imageCount > self.MAX_IMAGES and len(self.imageCache) > 1:
+            key, oldWaveform = self.imageCache.popitem(last=False)
+            oldWaveform.images = None
+            self.imageCount -= oldWaveform.numberOfPixmaps
\ No newline at end of file
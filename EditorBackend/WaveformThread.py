@@ -201,19 +201,51 @@ class WaveformThread(QThread):
 
         return [pointsMax, pointsMin]
 
+    def images(self, waveform):
+        """
+        Paints the points lists of a waveform to one QImage per subblock, layering the RMS plot on top of the peak
+        plot. The points lists are kept, so the images can be painted again once WaveformBufferChannel dropped them.
+
+        :param waveform: A waveform object with its points lists already calculated.
+        :return: List of QImages, one per subblock.
+        """
+        images = list()
+        for pixmapNo in range(0, waveform.numberOfPixmaps):
+            image = QImage(1000, waveform.height, QImage.Format_ARGB32_Premultiplied)
+            image.fill(Qt.transparent)
+
+            painter = QPainter()
+            painter.begin(image)
+            polygon = QPolygon()
+            painter.setPen(Qt.darkBlue)
+            polygon.setPoints(waveform.pointsMax[4000*pixmapNo:4000*(pixmapNo+1)])
+            painter.drawPolyline(polygon)
+            painter.setPen(Qt.blue)
+            polygon.setPoints(waveform.pointsRMS[4000*pixmapNo:4000*(pixmapNo+1)])
+            painter.drawPolyline(polygon)
+            painter.end()
+
+            images.append(image)
+
+        return images
+
     def draw(self):
         """
         Computes the list of points to a pixmap drawing. In this setup will create a layering of Peak and RMS display.
         For close zoom levels it switches to the linear display and also uses spreads out the entire waveform-drawing
         over several pixmaps (subblocks) to account for a limited maximum size of QPixmaps. Finished pixmaps are sent
-        to the backend through a signal. New: pixmap rendering has been moved to TrackWaveform.
+        to the backend through a signal. The points lists are painted to QImages here as well, which unlike QPixmaps
+        may be painted outside of the GUI thread. TrackWaveform only has to convert and scale them.
         """
 
         self.mutex.lock()
         waveform = self.waveforms.get()
 
         try:
-            [waveform.pointsMax, waveform.pointsRMS] = self.points(1000*waveform.numberOfPixmaps, waveform.height, waveform.dataSrc)
+            # Waveforms whose images have been dropped from the cache come back with their points lists
+            if waveform.pointsMax is None:
+                [waveform.pointsMax, waveform.pointsRMS] = self.points(1000*waveform.numberOfPixmaps, waveform.height, waveform.dataSrc)
+            waveform.images = self.images(waveform)
 
         except:
             print(traceback.format_exc())
@@ -18,382 +18,392 @@ from PyQt5.Qt import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 
+import time
+from collections import namedtuple
+
 from EditorBackend.Waveform import Waveform
 
 
-class TrackAbstract(QWidget):
+class _BatchProcessor(object):
 
     """
-    TrackAbstract is the superclass from which most elements or layers of a Track inherit. That way they all share an
-    identical interface based around Qt's signal-slot-concept. The signals and slots all have defined connections to
-    their respective slots and signals of the parent object. Therefore, if an object of a class inherited from
-    TrackAbstract creates another object that is also from a class that inherits TrackAbstract, their interface will
-    automatically be connected in the way described here. This allows for an easy layering of objects, without any
-    boilerplate connection making code whilst not breaking encapsulation rules. See the overall documentation of SNARE
-    for a more detailed explanation on this design-pattern.
+    Collects work of the track layers and processes it on the next pass of the event loop, level by level. This way a
+    synchronous chain of signals (e.g. one redraw per track when setting a mark) results in each layer clearing,
+    painting and scrolling once instead of alternating between reading and changing the scene for every signal. Work is
+    identified by its callable, adding it again before it has been processed only replaces its arguments.
     """
 
-    # SIGNALS
-    # from Hardware
-    sig_mousePress = pyqtSignal(QGraphicsSceneMouseEvent)
-    sig_mouseRelease = pyqtSignal(QGraphicsSceneMouseEvent)
-    sig_mouseMove = pyqtSignal(QGraphicsSceneMouseEvent)
-    sig_mouseDoubleClick = pyqtSignal(QGraphicsSceneMouseEvent)
-    sig_keyEnter = pyqtSignal(QKeyEvent)
-    sig_keyRelease = pyqtSignal(QKeyEvent)
-
-    # from PushButtons or Keyboard
-    sig_playpause = pyqtSignal()
-    sig_zoomIn = pyqtSignal()
-    sig_zoomOut = pyqtSignal()
-    sig_analyze = pyqtSignal()
-    sig_finishSelection = pyqtSignal()
-    sig_editSelection = pyqtSignal()
-    sig_selectionChange = pyqtSignal(str, str)
-    sig_skipForward = pyqtSignal()
-    sig_skipBackward = pyqtSignal()
-    sig_delete = pyqtSignal()
-    sig_requestMark = pyqtSignal()
-
-    # generated by program
-    sig_requestWaveform = pyqtSignal(int, int, int)
-    sig_viewChanged = pyqtSignal(QRectF)
-
-    # Signals travelling in opposite direction
-    # ToDo Mark travelling direction in naming convention
-    sig_redraw = pyqtSignal(float)
-    sig_startSelection = pyqtSignal(QGraphicsSceneMouseEvent)
-    sig_moveSelection = pyqtSignal(QGraphicsSceneMouseEvent)
-    sig_endSelection = pyqtSignal(QGraphicsSceneMouseEvent)
-    sig_enableSelection = pyqtSignal(bool)
-    sig_setSelection = pyqtSignal(str, str, dict, str)
-    sig_setMark = pyqtSignal(int)
-    sig_addWaveform = pyqtSignal(Waveform)
-    sig_setView = pyqtSignal(QRectF)
-    sig_update = pyqtSignal(float)
-    sig_setPlaying = pyqtSignal(bool)
+    def __init__(self):
+        self.levels = dict()
+        self.scheduled = False
 
-    def __init__(self, name, state, selections, analysisTypes, marks, cursorposition, height, width, smptopix, zoom, root=None):
+    def add(self, level, fn, *args):
         """
-        After all signals have been created it is checked if a root-object has been supplied. If so, all connections
-        will be made. Naming the parent "root" is to avoid confusion with the parent of a QWidget, which refers to a
-        user-interface structure and not the object relations.
+        Schedules a callable.
 
-        :param name: Name assigned to this track
-        :param state: Lock-state on creation
-        :param selections: Initial list of selection names
-        :param analysisTypes: Initial list of analysis types
-        :param marks: Initial list of marks on the time axis. Not relevant here.
-        :param cursorposition: Initial cursor position. Not relevant here.
-        :param height: Dimensions available for the entire track.
-        :param width:  Dimensions available for the entire track.
-        :param smptopix: Conversion factor, how many samples are displayed as one pixel. (At zoom-factor 1)
-        :param zoom: Initial zoom-factor
-        :param parent: The object on top of which this object is stacked in the layer structure.
+        :param level: Levels are processed in ascending order, see the LEVEL_ constants of TrackAbstract.
+        :param fn: The callable to process.
+        :param args: Arguments to call it with.
         """
-        super(TrackAbstract, self).__init__()
-
-        # Parameters to members
-        self.name = name
-        self.state = state
-        self.selections = selections
-        self.marks = marks
-        self.cursorposition = cursorposition
-        self.height = height
-        self.width = width
-        self.smptopix = smptopix
-        self.zoom = zoom
+        self.levels.setdefault(level, dict())[fn] = args
+        if not self.scheduled:
+            self.scheduled = True
+            QTimer.singleShot(0, self.flush)
 
-        # named "root" instead of "parent" to avoid confusion with the qt-widget-parent
-        self.root = None
-        if root:
-            # Handover Signal to parent-widget
-            self.root = root
-            # from Hardware
-            self.sig_mousePress.connect(self.root.slo_mousePress)
-            self.sig_mouseRelease.connect(self.root.slo_mouseRelease)
-            self.sig_mouseMove.connect(self.root.slo_mouseMove)
-            self.sig_mouseDoubleClick.connect(self.root.slo_mouseDoubleClick)
-            self.sig_keyEnter.connect(self.root.slo_keyEnter)
-            self.sig_keyRelease.connect(self.root.slo_keyRelease)
-
-            # from PushButtons or Keyboard
-            self.sig_playpause.connect(self.root.slo_playpause)
-            self.sig_zoomIn.connect(self.root.slo_zoomIn)
-            self.sig_zoomOut.connect(self.root.slo_zoomOut)
-            self.sig_analyze.connect(self.root.slo_analyze)
-            self.sig_finishSelection.connect(self.root.slo_finishSelection)
-            self.sig_editSelection.connect(self.root.slo_editSelection)
-            self.sig_selectionChange.connect(self.root.slo_selectionChange)
-            self.sig_skipForward.connect(self.root.slo_skipForward)
-            self.sig_skipBackward.connect(self.root.slo_skipBackward)
-            self.sig_delete.connect(self.root.slo_delete)
-            self.sig_requestMark.connect(self.root.slo_requestMark)
-
-            # Generated by program
-            self.sig_requestWaveform.connect(self.root.slo_requestWaveform)
-            self.sig_viewChanged.connect(self.root.slo_viewChanged)
-
-            # Signals travelling in opposite direction
-            self.root.sig_redraw.connect(self.slo_redraw)
-            self.root.sig_startSelection.connect(self.slo_startSelection)
-            self.root.sig_moveSelection.connect(self.slo_moveSelection)
-            self.root.sig_endSelection.connect(self.slo_endSelection)
-            self.root.sig_enableSelection.connect(self.slo_enableSelection)
-            self.root.sig_setSelection.connect(self.slo_setSelection)
-            self.root.sig_setMark.connect(self.slo_setMark)
-            self.root.sig_addWaveform.connect(self.slo_addWaveform)
-            self.root.sig_setView.connect(self.slo_setView)
-            self.root.sig_update.connect(self.slo_update)
-            self.root.sig_setPlaying.connect(self.slo_setPlaying)
-
-    # Default Signal-Relais
-    # from Hardware
-    def slo_mousePress(self, QGraphicsSceneMouseEvent):
-        """
-        Relays the signal to the parent object. Catches any mouse event triggered on any layer of the Track and sends it
-        through all layers to TrackManager where it will be processed.
-
-        :param QGraphicsSceneMouseEvent: Qt mouse event type.
+    def flush(self):
         """
-        self.sig_mousePress.emit(QGraphicsSceneMouseEvent)
-
-    def slo_mouseRelease(self, QGraphicsSceneMouseEvent):
+        Processes all scheduled work. Work scheduled while flushing is processed in the same pass.
         """
-        Relays the signal to the parent object. Catches any mouse event triggered on any layer of the Track and sends it
-        through all layers to TrackManager where it will be processed.
+        try:
+            while self.levels:
+                level = min(self.levels)
+                for fn, args in self.levels.pop(level).items():
+                    fn(*args)
+        finally:
+            self.levels.clear()
+            self.scheduled = False
 
-        :param QGraphicsSceneMouseEvent: Qt mouse event type.
-        """
-        self.sig_mouseRelease.emit(QGraphicsSceneMouseEvent)
 
-    def slo_mouseMove(self, QGraphicsSceneMouseEvent):
-        """
-        Relays the signal to the parent object. Catches any mouse event triggered on any layer of the Track and sends it
-        through all layers to TrackManager where it will be processed.
+_BATCH = _BatchProcessor()
 
-        :param QGraphicsSceneMouseEvent: Qt mouse event type.
-        """
-        self.sig_mouseMove.emit(QGraphicsSceneMouseEvent)
 
-    def slo_mouseDoubleClick(self, QGraphicsSceneMouseEvent):
-        """
-        Relays the signal to the parent object. Catches any mouse event triggered on any layer of the Track and sends it
-        through all layers to TrackManager where it will be processed.
+class MouseEventLite(namedtuple('MouseEventLite', 'x y buttons modifiers timestamp')):
 
-        :param QGraphicsSceneMouseEvent: Qt mouse event type.
-        """
-        self.sig_mouseDoubleClick.emit(QGraphicsSceneMouseEvent)
+    """
+    The part of a QGraphicsSceneMouseEvent the layers actually use. TrackScene converts every mouse event once, from
+    then on only this tuple travels along the signal lines. Unlike the Qt event it stays valid after the event has
+    been handled, so it may be stored and emitted later.
+    """
 
-    def slo_keyEnter(self, QKeyEvent):
-        """
-        Relays the signal to the parent object. Catches any keyboard event triggered on any layer of the Track and sends
-        it through all layers to TrackManager where it will be processed.
+    __slots__ = ()
 
-        :param QKeyEvent: Qt key event type.
+    @classmethod
+    def fromEvent(cls, QGraphicsSceneMouseEvent, buttons):
         """
-        self.sig_keyEnter.emit(QKeyEvent)
+        Extracts the fields from a Qt mouse event. QGraphicsSceneMouseEvent does not report a time stamp in Qt5, so the
+        time of the conversion in milliseconds is used instead.
 
-    def slo_keyRelease(self, QKeyEvent):
+        :param QGraphicsSceneMouseEvent: Qt mouse event type.
+        :param buttons: The button that caused the event (press, release, double click) or the buttons held (move).
+        :return: MouseEventLite
         """
-        Relays the signal to the parent object. Catches any keyboard event triggered on any layer of the Track and sends
-        it through all layers to TrackManager where it will be processed.
+        pos = QGraphicsSceneMouseEvent.scenePos()
+        return cls(pos.x(), pos.y(), int(buttons), int(QGraphicsSceneMouseEvent.modifiers()),
+                   int(time.monotonic() * 1000))
 
-        :param QKeyEvent: Qt key event type.
-        """
-        self.sig_keyRelease.emit(QKeyEvent)
 
-    # from PushButtons or Keyboard
-    def slo_playpause(self):
-        """
-        Relays the signal to the parent object. For pressing play or pause (a switch button) at TrackButtons.
-        """
-        self.sig_playpause.emit()
+class TrackSignalMeta(type(QObject)):
 
-    def slo_zoomIn(self):
-        """
-        Relays the signal to the parent object. For pressing "+" at TrackButtons.
-        """
-        self.sig_zoomIn.emit()
+    """
+    Generates the signals of a TrackSignalBroker from its _SIGNAL_SPEC. Each entry (name, types, direction) becomes a
+    signal "sig_" + name with the given argument types and a (signal, slot) name pair in _UP_CONNECTIONS or
+    _DOWN_CONNECTIONS, depending on the direction in which the signal travels through the layer structure.
+    """
 
-    def slo_zoomOut(self):
-        """
-        Relays the signal to the parent object. For pressing "-" at TrackButtons.
-        """
-        self.sig_zoomOut.emit()
+    def __new__(mcs, name, bases, namespace):
+        up = list()
+        down = list()
+        for signalName, types, direction in namespace.get('_SIGNAL_SPEC', ()):
+            namespace['sig_' + signalName] = pyqtSignal(*types)
+            (up if direction == 'up' else down).append(('sig_' + signalName, 'slo_' + signalName))
+        namespace['_UP_CONNECTIONS'] = tuple(up)
+        namespace['_DOWN_CONNECTIONS'] = tuple(down)
+        return super(TrackSignalMeta, mcs).__new__(mcs, name, bases, namespace)
 
-    def slo_analyze(self):
-        """
-        Relays the signal to the parent object. For pressing "Analyze" at TrackButtons.
-        """
-        self.sig_analyze.emit()
 
-    def slo_finishSelection(self):
-        """
-        Relays the signal to the parent object. For setting the selection state to "locked". (Lock symbol at
-        TrackButtons)
-        """
-        self.sig_finishSelection.emit()
+class TrackSignalBroker(QObject, metaclass=TrackSignalMeta):
 
-    def slo_editSelection(self):
-        """
-        Relays the signal to the parent object. For setting the selection state to "unlocked". (Lock symbol at
-        TrackButtons)
-        """
-        self.sig_editSelection.emit()
+    """
+    Holds the signals of the layer structure. Only layers that have other layers stacked on top (TrackManager, TrackUI,
+    TrackView) and the TrackOverview own a broker, all other layers publish and subscribe directly on the broker of
+    their root. This way the signals of a track exist once per broker instead of once per layer and a layer only
+    connects to the signals it actually handles. The broker is a child of its owner, so TrackManager can tell which
+    track a signal came from by the parent of the sender.
+    The signals are declared in _SIGNAL_SPEC, see TrackSignalMeta.
+    """
 
-    def slo_selectionChange(self, selectionName, analysisType):
-        """
-        Relays the signal to the parent object. Triggered when one of the dropdown menus at TrackButtons changed.
+    _SIGNAL_SPEC = [
+        # from Hardware
+        ('mousePress', (MouseEventLite,), 'up'),
+        ('mouseRelease', (MouseEventLite,), 'up'),
+        ('mouseDoubleClick', (MouseEventLite,), 'up'),
+        ('keyEnter', (QKeyEvent,), 'up'),
+        ('keyRelease', (QKeyEvent,), 'up'),
+
+        # from PushButtons or Keyboard
+        ('playpause', (), 'up'),
+        ('zoomIn', (), 'up'),
+        ('zoomOut', (), 'up'),
+        ('analyze', (), 'up'),
+        ('finishSelection', (), 'up'),
+        ('editSelection', (), 'up'),
+        ('selectionChange', (str, str), 'up'),
+        ('skipForward', (), 'up'),
+        ('skipBackward', (), 'up'),
+        ('delete', (), 'up'),
+        ('requestMark', (), 'up'),
+
+        # generated by program
+        ('requestWaveform', (int, int, int), 'up'),
+        ('viewChanged', (QRectF,), 'up'),
+
+        # Signals travelling in opposite direction
+        ('redraw', (float,), 'down'),
+        ('startSelection', (MouseEventLite,), 'down'),
+        ('moveSelection', (MouseEventLite,), 'down'),
+        ('endSelection', (MouseEventLite,), 'down'),
+        ('enableSelection', (bool,), 'down'),
+        ('setSelection', (str, str, dict, str), 'down'),
+        ('setMark', (int,), 'down'),
+        ('addWaveform', (Waveform,), 'down'),
+        ('setView', (QRectF,), 'down'),
+        ('update', (float,), 'down'),
+        ('setPlaying', (bool,), 'down'),
+    ]
+
+
+class _NullRoot(QObject):
 
-        :param selectionName: Name of the new selection.
-        :param analysisType: Name of the new analysis type.
-        """
-        self.sig_selectionChange.emit(selectionName, analysisType)
+    """
+    The root of the top layer (TrackManager). It has a broker like every other root, but nothing is ever emitted on it
+    or relayed to it.
+    """
 
-    def slo_skipForward(self):
-        """
-        Relays the signal to the parent object. A request from TrackButtons to skip to the next mark.
-        """
-        self.sig_skipForward.emit()
+    # No slots, every signal of the top layer ends at its own broker
+    _SLOTS = frozenset()
 
-    def slo_skipBackward(self):
-        """
-        Relays the signal to the parent object. A request from TrackButtons to skip to the previous mark.
-        """
-        self.sig_skipBackward.emit()
+    def __init__(self):
+        super(_NullRoot, self).__init__()
+        self.broker = TrackSignalBroker(self)
 
-    def slo_delete(self):
-        """
-        Relays the signal to the parent object. A request from TrackButtons to delete this track.
-        """
-        self.sig_delete.emit()
 
-    def slo_requestMark(self):
-        """
-        Relays the signal to the parent object. A request from TrackButtons to place a mark on the current TrackCursor
-        position.
-        """
-        self.sig_requestMark.emit()
+_NULL_ROOT = _NullRoot()
 
-    # generated by program
-    def slo_requestWaveform(self, block, widthPreScaling, height):
-        """
-        Relays the signal to the parent object. A signal from TrackWaveform, requesting the backend to render a specific
-        waveform pixmap. The channel association is added at TrackManager.
 
-        :param block: The block to be rendered.
-        :param widthPreScaling: The width to fit the pixmap of one block in. Therefore the width equals the zoom-level, since the blocksize is static.
-        :param height: Height of the pixmap.
-        """
-        self.sig_requestWaveform.emit(block, widthPreScaling, height)
+class TrackAbstract(QWidget):
 
-    def slo_viewChanged(self, QRectF):
-        """
-        Relays the signal to the parent object. A signal triggered when the user changed the view by scrolling or
-        dragging.
+    """
+    TrackAbstract is the superclass from which most elements or layers of a Track inherit. That way they all share an
+    identical interface based around Qt's signal-slot-concept. The signals and slots all have defined connections to
+    their respective slots and signals of the parent object. Therefore, if an object of a class inherited from
+    TrackAbstract creates another object that is also from a class that inherits TrackAbstract, their interface will
+    automatically be connected in the way described here. This allows for an easy layering of objects, without any
+    boilerplate connection making code whilst not breaking encapsulation rules. See the overall documentation of SNARE
+    for a more detailed explanation on this design-pattern.
 
-        :param QRectF: The rectangle inside the scene that is now displayed by the view.
-        """
-        self.sig_viewChanged.emit(QRectF)
+    The signals live on a TrackSignalBroker (self.broker), which is shared by all layers that have no layers of their
+    own stacked on top. Signals are relayed by connecting them directly to the corresponding signal of the next broker.
+    A subclass only implements a "slo_" method for the signals it actually handles, e.g. TrackManager for signals
+    travelling upwards or TrackWaveform for signals travelling downwards. If such a layer has to pass the signal on as
+    well, its slot emits the signal on its own broker.
 
-    # Signals travelling in other direction
-    def slo_redraw(self, factor):
-        """
-        Relays the signal to child objects. An actual implementation can be found at TrackSelection, TrackWaveform
-        et al.
+    All objects of the layer structure live on the GUI thread and are connected with Qt.DirectConnection. Therefore
+    the signals of the brokers must only be emitted from the GUI thread. Results of the backend threads, e.g. the
+    rendered waveforms of WaveformThread, are handed over through queued connections in the backend before they
+    enter the layer structure at TrackManager.
+    """
 
-        :param factor: New zoom-level
-        """
-        self.sig_redraw.emit(factor)
+    # Layers with layers of their own stacked on top own a TrackSignalBroker, all others share the one of their root
+    _OWNS_BROKER = False
 
-    def slo_startSelection(self, QGraphicsSceneMouseEvent):
-        """
-        Relays the signal to child-objects. The destination of this signal-path is TrackSelection, it is one of four to
-        control the state machine of TrackSelection
+    # Signal lines as (signal, slot) name pairs, generated from TrackSignalBroker._SIGNAL_SPEC
+    _UP_CONNECTIONS = TrackSignalBroker._UP_CONNECTIONS
+    _DOWN_CONNECTIONS = TrackSignalBroker._DOWN_CONNECTIONS
+    # Resolved per subclass, see __init_subclass__
+    _SLOTS = frozenset()
+    _CONNECTIONS = tuple()
 
-        :param QGraphicsSceneMouseEvent: A Qt-type containing at least the mouse button that was pressed and the cursor position
-        """
-        self.sig_startSelection.emit(QGraphicsSceneMouseEvent)
+    # Levels of scheduled work, see schedule
+    LEVEL_SCENE = 0     # invalidate the scene
+    LEVEL_PAINT = 1     # paint into the scene
+    LEVEL_VIEWPORT = 2  # move the view widget
+    LEVEL_MEASURE = 3   # read the final view position
 
-    def slo_moveSelection(self, QGraphicsSceneMouseEvent):
+    def __init__(self, name, state, selections, analysisTypes, marks, cursorposition, height, width, smptopix, zoom, root=None):
         """
-        Relays the signal to child-objects. The destination of this signal-path is TrackSelection, it is one of four to
-        control the state machine of TrackSelection
+        All connections to the root-object will be made on creation. If no root-object has been supplied, the object is
+        the top layer and gets connected to a root that never emits any signal. Naming the parent "root" is to avoid
+        confusion with the parent of a QWidget, which refers to a user-interface structure and not the object relations.
 
-        :param QGraphicsSceneMouseEvent: A Qt-type containing at least the mouse button that was pressed and the cursor position
+        :param name: Name assigned to this track
+        :param state: Lock-state on creation
+        :param selections: Initial list of selection names
+        :param analysisTypes: Initial list of analysis types
+        :param marks: Initial list of marks on the time axis. Not relevant here.
+        :param cursorposition: Initial cursor position. Not relevant here.
+        :param height: Dimensions available for the entire track.
+        :param width:  Dimensions available for the entire track.
+        :param smptopix: Conversion factor, how many samples are displayed as one pixel. (At zoom-factor 1)
+        :param zoom: Initial zoom-factor
+        :param parent: The object on top of which this object is stacked in the layer structure.
         """
-        self.sig_moveSelection.emit(QGraphicsSceneMouseEvent)
+        super(TrackAbstract, self).__init__()
 
-    def slo_endSelection(self, QGraphicsSceneMouseEvent):
-        """
-        Relays the signal to child-objects. The destination of this signal-path is TrackSelection, it is one of four to
-        control the state machine of TrackSelection
+        # Parameters to members
+        self.name = name
+        self.state = state
+        self.selections = selections
+        self.marks = marks
+        self.cursorposition = cursorposition
+        self.height = height
+        self.width = width
+        self.smptopix = smptopix
+        self.zoom = zoom
 
-        :param QGraphicsSceneMouseEvent: A Qt-type containing at least the mouse button that was pressed and the cursor position
-        """
+        # Throttling of the high frequency signal lines to one emission per frame (16ms), see relayViewChanged and
+        # relayUpdate. Only few layers use them, so the timers are created on first use, see frameTimer
+        self._viewChangedTimer = None
+        self._updateTimer = None
+        self._pendingViewChanged = None
+        self._lastViewChanged = None
+        self._pendingUpdate = None
 
-        self.sig_endSelection.emit(QGraphicsSceneMouseEvent)
+        # Last values of the guarded signal lines, see relaySetMark, relaySetPlaying and relaySetSelection
+        self._lastMark = None
+        self._lastPlaying = None
+        self._lastSelection = None
 
-    def slo_enableSelection(self, bool):
-        """
-        Relays the signal to child-objects. The destination of this signal-path is TrackSelection, it is one of four to
-        control the state machine of TrackSelection
+        # named "root" instead of "parent" to avoid confusion with the qt-widget-parent
+        # The top layer is stacked on _NULL_ROOT, so there is no need to check for a missing root anywhere
+        self.root = root or _NULL_ROOT
+        # Mouse moves are not relayed by signals but collected in the queue of the TrackManager, see relayMouseMove.
+        # The top layer creates the queue itself.
+        if root is not None:
+            self.mouseMoveQueue = self.root.mouseMoveQueue
+        # Handover Signal to parent-widget. A layer implementing "slo_" + name handles the signal, otherwise it is relayed
+        # by the signal of its own broker
+        if self._OWNS_BROKER:
+            self.broker = TrackSignalBroker(self)
+            rootBroker = self.root.broker
+            rootSlots = self.root._SLOTS
+            for sig, slo in self._UP_CONNECTIONS:
+                target = getattr(self.root, slo) if slo in rootSlots else getattr(rootBroker, sig)
+                getattr(self.broker, sig).connect(target, Qt.DirectConnection)
+            for sig, slo in self._DOWN_CONNECTIONS:
+                target = getattr(self, slo) if slo in self._SLOTS else getattr(self.broker, sig)
+                getattr(rootBroker, sig).connect(target, Qt.DirectConnection)
+        else:
+            self.broker = self.root.broker
+            for sig, slo in self._CONNECTIONS:
+                getattr(self.broker, sig).connect(getattr(self, slo), Qt.DirectConnection)
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Looks up once per subclass which of the "slo_" methods it implements, instead of probing every signal line
+        again for each object in __init__. _SLOTS holds the names of all implemented slots, _CONNECTIONS the
+        (signal, slot) name pairs of the signals travelling towards the layers stacked on top that the subclass
+        handles.
+        """
+        super(TrackAbstract, cls).__init_subclass__(**kwargs)
+        cls._SLOTS = frozenset(slo for sig, slo in cls._UP_CONNECTIONS + cls._DOWN_CONNECTIONS if hasattr(cls, slo))
+        cls._CONNECTIONS = tuple((sig, slo) for sig, slo in cls._DOWN_CONNECTIONS if slo in cls._SLOTS)
+
+    # Throttled signal lines
+    def relayMouseMove(self, event):
+        """
+        Puts the mouse move into the mouse move queue together with the broker it came from. The queue only holds the
+        latest move, the TrackManager takes it from there once per frame while a mouse button is held.
+
+        :param event: MouseEventLite
+        """
+        self.mouseMoveQueue.append((self.broker, event))
+
+    def relayViewChanged(self, rect):
+        """
+        Emits sig_viewChanged at most once per frame with the latest rectangle. Scrolling triggers several signals of
+        the view widget for the same position, if the latest rectangle at the end of the frame equals the one emitted
+        last, nothing is emitted.
+
+        :param rect: The rectangle inside the scene that is now displayed by the view.
+        """
+        self._pendingViewChanged = QRectF(rect)
+        if self._viewChangedTimer is None:
+            self._viewChangedTimer = self.frameTimer(self._emitViewChanged)
+        if not self._viewChangedTimer.isActive():
+            self._viewChangedTimer.start()
+
+    def _emitViewChanged(self):
+        if self._pendingViewChanged == self._lastViewChanged:
+            return
+        self._lastViewChanged = self._pendingViewChanged
+        self.broker.sig_viewChanged.emit(self._pendingViewChanged)
+
+    def relayUpdate(self, pos):
+        """
+        Emits sig_update at most once per frame with the latest position. Unlike sig_viewChanged an unchanged position
+        is still emitted: while recording, the waveform has to be requested again for the same position.
 
-        :param bool: Enter False to block the selection from changes
+        :param pos: Position in samples around which to update the view and scene.
         """
+        self._pendingUpdate = pos
+        if self._updateTimer is None:
+            self._updateTimer = self.frameTimer(self._emitUpdate)
+        if not self._updateTimer.isActive():
+            self._updateTimer.start()
 
-        self.sig_enableSelection.emit(bool)
+    def _emitUpdate(self):
+        self.broker.sig_update.emit(self._pendingUpdate)
 
-    def slo_setSelection(self, selectionName, analysisType, selection, state):
+    def frameTimer(self, fn):
         """
-        Relays the signal to child-objects. The destination of this signal-path is TrackSelection and TrackButtons.
+        Creates a single shot timer that calls fn once the current frame (16ms) is over.
 
-        :param selectionName: Name of the selection to switch to.
-        :param analysisType: Name of the type of analysis associated with the current selection.
-        :param selection: Start and end samples of the actual selection.
-        :param state: Lock state of the selection
+        :param fn: The callable to call on timeout.
+        :return: QTimer
         """
-        self.sig_setSelection.emit(selectionName, analysisType, selection, state)
+        timer = QTimer(self, singleShot=True, interval=16)
+        timer.timeout.connect(fn, Qt.DirectConnection)
+        return timer
 
-    def slo_setMark(self, smp):
+    # Guarded signal lines
+    def relaySetMark(self, smp):
         """
-        Relays the signal to child-objects. The destination of this signal-path is TrackMarks.
+        Emits sig_setMark unless a mark has just been set at the same position.
 
-        :param smp: Sample on which to put a mark
+        :param smp: Position of the mark in samples.
+        :return: True if the signal was emitted.
         """
-        self.sig_setMark.emit(smp)
+        if smp == self._lastMark:
+            return False
+        self._lastMark = smp
+        self.broker.sig_setMark.emit(smp)
+        return True
 
-    def slo_addWaveform(self, Waveform):
+    def relaySetPlaying(self, bool):
         """
-        Relays the signal to child-objects. The destination of this signal-path is TrackWaveform.
+        Emits sig_setPlaying if the playback state differs from the one emitted last.
 
-        :param Waveform: a Waveform-object.
+        :param bool: True if playback is on.
         """
-        self.sig_addWaveform.emit(Waveform)
+        if bool == self._lastPlaying:
+            return
+        self._lastPlaying = bool
+        self.broker.sig_setPlaying.emit(bool)
 
-    def slo_setView(self, QRectF):
+    def relaySetSelection(self, selectionName, analysisType, points, state):
         """
-        Relays the signal to child-objects. The destination of this signal-path is TrackView.
+        Emits sig_setSelection if the selection differs from the one emitted last. The selection points are compared
+        against a copy, since TrackSelection edits the dict it received in place.
 
-        :param QRectF: A rectangle describing the part of the QGraphicScene to display.
+        :param selectionName: Name of the selection.
+        :param analysisType: Name of the type of analysis associated with the selection.
+        :param points: Start and end-samples of the selection areas.
+        :param state: Lock state of the selection.
         """
-        self.sig_setView.emit(QRectF)
+        selection = (selectionName, analysisType, dict(points), state)
+        if selection == self._lastSelection:
+            return
+        self._lastSelection = selection
+        self.broker.sig_setSelection.emit(selectionName, analysisType, points, state)
 
-    def slo_update(self, pos):
+    def schedule(self, level, fn, *args):
         """
-        Relays the signal to child-objects. The destination of this signal-path are all objects related to the waveform
-        display, e.g. TrackWaveform and TrackTimeline.
+        Defers work that changes the scene or the view widget to the next pass of the event loop. Work of all layers is
+        processed together level by level and each callable only once, no matter how often it was scheduled.
 
-        :param pos: Position in samples around which to update the view and scene.
-        """
-        self.sig_update.emit(pos)
-
-    def slo_setPlaying(self, bool):
+        :param level: One of the LEVEL_ constants.
+        :param fn: The callable to process.
+        :param args: Arguments to call it with.
         """
-        Relays the signal to child-objects. The destination of this signal-path is the play/pause-button of
-        TrackButtons. It is necessary to display the right playback state on each channel.
+        _BATCH.add(level, fn, *args)
 
-        :param bool: True if playing.
-        """
-        self.sig_setPlaying.emit(bool)
@@ -69,7 +69,7 @@ class TrackButtons(TrackAbstract):
         # First Row
         self.firstRow = QHBoxLayout()
 
-        self.deleteButton = QToolButton(clicked=self.sig_delete)
+        self.deleteButton = QToolButton(clicked=self.broker.sig_delete)
         self.deleteButton.setIcon(self.style().standardIcon(QStyle.SP_TitleBarCloseButton))
         self.deleteButton.setToolTip('Delete channel')
 
@@ -103,7 +103,7 @@ class TrackButtons(TrackAbstract):
         # Third Row
         self.thirdRow = QHBoxLayout()
 
-        self.analButton = QPushButton(clicked=self.sig_analyze)
+        self.analButton = QPushButton(clicked=self.broker.sig_analyze)
         self.analButton.setText("Analyze")
         self.analButton.setToolTip('Start analyse')
 
@@ -112,26 +112,26 @@ class TrackButtons(TrackAbstract):
         # Fourth Row
         self.fourthRow = QGridLayout()
 
-        self.zoomPlusButton = QPushButton(clicked=self.sig_zoomIn)
+        self.zoomPlusButton = QPushButton(clicked=self.broker.sig_zoomIn)
         self.zoomPlusButton.setText("+")
         self.zoomPlusButton.setToolTip('Zoom in')
         self.zoomLabel = QLabel(str('{0:.2f}'.format(self.zoom)))
         self.zoomLabel.setMinimumWidth(30)
         self.zoomLabel.setAlignment(Qt.AlignCenter)
-        self.zoomMinusButton = QPushButton(clicked=self.sig_zoomOut)
+        self.zoomMinusButton = QPushButton(clicked=self.broker.sig_zoomOut)
         self.zoomMinusButton.setText("-")
         self.zoomMinusButton.setToolTip('Zoom out')
 
-        self.playButton = QPushButton(clicked=self.sig_playpause)
+        self.playButton = QPushButton(clicked=self.broker.sig_playpause)
         self.playButton.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
         self.playButton.setToolTip("Play/Pause audio channel")
-        self.skipForwardButton = QPushButton(clicked=self.sig_skipForward)
+        self.skipForwardButton = QPushButton(clicked=self.broker.sig_skipForward)
         self.skipForwardButton.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipForward))
         self.skipForwardButton.setToolTip('Jump to next marker')
-        self.skipBackwardButton = QPushButton(clicked=self.sig_skipBackward)
+        self.skipBackwardButton = QPushButton(clicked=self.broker.sig_skipBackward)
         self.skipBackwardButton.setIcon(self.style().standardIcon(QStyle.SP_MediaSkipBackward))
         self.skipBackwardButton.setToolTip('Jump to last marker')
-        self.markerButton = QPushButton(clicked=self.sig_requestMark)
+        self.markerButton = QPushButton(clicked=self.broker.sig_requestMark)
         self.markerButton.setIcon(QIcon(self.resource_path("EditorUI/Marker.png")))
 
         self.markerButton.setStyleSheet("QToolButton {border-style: outset; border-width: 0px;}");
@@ -160,6 +160,7 @@ class TrackButtons(TrackAbstract):
         self.setLayout(self.layout)
         self.show()
 
+    @pyqtSlot(float)
     def slo_redraw(self, factor):
         """
         Set the zoom level label.
@@ -168,6 +169,7 @@ class TrackButtons(TrackAbstract):
         val = round(1/factor, 4)
         self.zoomLabel.setText(str('{0:.2f}'.format(val)))
 
+    @pyqtSlot(bool)
     def slo_setPlaying(self, bool):
         """
         Sets the "play"-buttons icon to represent the playback state of this channel.
@@ -185,7 +187,7 @@ class TrackButtons(TrackAbstract):
         """
         selection = self.selectSelection.currentText()
         analysisType = self.typeSelection.currentText()
-        self.sig_selectionChange.emit(selection, analysisType)
+        self.broker.sig_selectionChange.emit(selection, analysisType)
 
     def lock(self):
         """
@@ -196,13 +198,13 @@ class TrackButtons(TrackAbstract):
 
             self.lockButton.update()
             self.lockState = "Unlocked"
-            self.sig_editSelection.emit()
+            self.broker.sig_editSelection.emit()
         elif self.lockState == "Unlocked":
             self.lockButton.setIcon(QIcon(self.resource_path("EditorUI/Lock.png")))
 
             self.lockButton.update()
             self.lockState = "Locked"
-            self.sig_finishSelection.emit()
+            self.broker.sig_finishSelection.emit()
 
     def resource_path(self, relative_path):
         if hasattr(sys, '_MEIPASS'):
@@ -210,6 +212,7 @@ class TrackButtons(TrackAbstract):
         return os.path.join(os.path.abspath("."), relative_path)
 
     # --- Public ---
+    @pyqtSlot(str, str, dict, str)
     def slo_setSelection(self, selectionName, analysisType, selection, state):
         """
         If the selection has been changed by the user at one track or by the program, the new state is synchronised over
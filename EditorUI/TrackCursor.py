@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 
 from EditorUI.TrackAbstract import TrackAbstract
@@ -59,12 +60,20 @@ class TrackCursor(TrackAbstract):
         pos = smp/self.smptopix
         self.cursor.setX(pos*self.factor)
 
+    @pyqtSlot(float)
     def slo_redraw(self, factor=1):
         """
-        Adjusting the cursor position whenever the zoom-level changes.
+        Adjusting the cursor position whenever the zoom-level changes. The line is drawn again once the scene has been
+        cleared, see drawCursor.
 
         :param factor: The new zoom-factor
         """
         self.factor = factor
+        self.schedule(self.LEVEL_PAINT, self.drawCursor)
+
+    def drawCursor(self):
+        """
+        Adds the cursor line to the scene at the current position.
+        """
         self.cursor = self.scene.addLine(0, 0, 0, self.height, QPen())
         self.setCursor(self.smp)
@@ -15,11 +15,15 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 from PyQt5.QtCore import *
+from PyQt5.Qt import *
 
-from EditorUI.TrackAbstract import TrackAbstract
+from collections import deque
+
+from EditorUI.TrackAbstract import TrackAbstract, MouseEventLite
 from EditorUI.TrackUI import TrackUI
 from EditorUI.TrackData import TrackData
 from EditorBackend.Channel import Channel
+from EditorBackend.Waveform import Waveform
 
 from EditorUI.TrackOverview import TrackOverview
 
@@ -44,6 +48,8 @@ class TrackManager(TrackAbstract):
     getWaveform = pyqtSignal(Channel, int, int, int)
     deleteChannel = pyqtSignal(Channel, TrackUI)
 
+    _OWNS_BROKER = True
+
     def __init__(self, analyses, blockSize):
         """
         Defines the initial state of the editor area and reserves memory for all Track elements that will follow.
@@ -65,6 +71,10 @@ class TrackManager(TrackAbstract):
 
         self.factor = 1
 
+        # Latest mouse move of any track, processed once per frame while a mouse button is held, see processMouseMove.
+        # All layers stacked on top share it.
+        self.mouseMoveQueue = deque(maxlen=1)
+
         super(TrackManager, self).__init__(self.name, self.state, self.selectionNames, self.analysisTypes, self.marks,
                                            self.cursorposition, self.height, self.width, self.smptopix, self.factor)
         # A place to store all track-Objects
@@ -78,11 +88,24 @@ class TrackManager(TrackAbstract):
 
         self.overview = None
 
+        self._mouseMoveTimer = QTimer(self, interval=16)
+        self._mouseMoveTimer.timeout.connect(self.processMouseMove, Qt.DirectConnection)
+
+    def senderTrack(self):
+        """
+        Signals of a track arrive through the broker of the track. Returns the track itself, e.g. to look up its
+        TrackData.
+
+        :return: The TrackUI (or TrackOverview) whose broker sent the signal currently being handled.
+        """
+        return self.sender().parent()
+
+    @pyqtSlot()
     def slo_playpause(self):
         """
         Behaviour when pressing the "play/pause" button. (Or triggering the same event possibly with a key)
         """
-        trackData = self.trackData[self.sender()]
+        trackData = self.trackData[self.senderTrack()]
 
         if trackData.isPlaying():
             self.playing = False
@@ -101,7 +124,7 @@ class TrackManager(TrackAbstract):
             self.playerPlay.emit()
 
         for track in self.tracks:
-            track.slo_setPlaying(self.trackData[track].isPlaying())
+            track.relaySetPlaying(self.trackData[track].isPlaying())
 
     def updateSmp(self, smp, channel):
         """
@@ -118,13 +141,14 @@ class TrackManager(TrackAbstract):
                 trackData.setLastPos(smp)
                 track.setCursor(smp)
 
+    @pyqtSlot()
     def slo_analyze(self):
         """
         Triggered when the "analyze"-button was pressed. The method gathers the selection points/area (in samples)
         and the relevant channel-reference and passes the information to the backend via the "addSelection" signal.
         """
-        trackData = self.trackData[self.sender()]
-        [points, state] = self.sender().getSelectionPoints()
+        trackData = self.trackData[self.senderTrack()]
+        [points, state] = self.senderTrack().getSelectionPoints()
         trackData.updateCurrentSelection(points)
 
         [selectionName, points, state, analysisType] = trackData.getCurrentSelection()
@@ -133,6 +157,7 @@ class TrackManager(TrackAbstract):
         if points:
             self.addSelection.emit(channel, selectionName, points, analysisType)
 
+    @pyqtSlot(Waveform)
     def slo_addWaveform(self, waveform):
         """
         This is the place where rendered waveforms from the backend are processed. They are filtered according to the
@@ -142,68 +167,78 @@ class TrackManager(TrackAbstract):
         """
         for track in self.tracks:
             if self.trackData[track].channel is waveform.channel:
-                track.slo_addWaveform(waveform)
+                track.broker.sig_addWaveform.emit(waveform)
 
+    @pyqtSlot()
     def slo_finishSelection(self):
         """
         This loops back the signal to block a selection. Could be changed e.g. to block all Selections with one event.
         """
-        self.sender().slo_enableSelection(False)
+        self.sender().sig_enableSelection.emit(False)
 
+    @pyqtSlot()
     def slo_editSelection(self):
         """
         This loops back the signal to unblock a selection. Could be changed e.g. to block all Selections with one event.
         """
-        self.sender().slo_enableSelection(True)
+        self.sender().sig_enableSelection.emit(True)
 
-    def slo_mouseDoubleClick(self, QGraphicsSceneMouseEvent):
+    @pyqtSlot(MouseEventLite)
+    def slo_mouseDoubleClick(self, MouseEventLite):
         """
         Triggered by a double click on TrackView. Places the TrackCursor on the requested position. The received
         position is translated to the position on the scene and then to samples. The value is stored in the TrackData
         object and the signal to set the cursor is emitted.
 
-        :param QGraphicsSceneMouseEvent: Qt mouse event type containing the position on the scene where the click event
+        :param MouseEventLite: Mouse event containing the position on the scene where the click event
          was triggered
         """
-        pos = QGraphicsSceneMouseEvent.scenePos().x()
+        pos = MouseEventLite.x
         pos /= self.factor
         smp = int(pos * self.smptopix)
-        self.trackData[self.sender()].setLastPos(smp)
-        self.sender().setCursor(smp)
+        self.trackData[self.senderTrack()].setLastPos(smp)
+        self.senderTrack().setCursor(smp)
 
-    def slo_mousePress(self, QGraphicsSceneMouseEvent):
+    @pyqtSlot(MouseEventLite)
+    def slo_mousePress(self, MouseEventLite):
         """
         Triggered by a mouse press on TrackView. The signal is multiplied to all tracks and used to control the
         selection rectangles. It would also be possible to loop back the signal to only one track instead of having
         synchronised selections on all tracks.
 
-        :param QGraphicsSceneMouseEvent: Qt mouse event type containing the position on the scene, where the event was
+        :param MouseEventLite: Mouse event containing the position on the scene, where the event was
          triggered.
         """
-        self.sender().slo_startSelection(QGraphicsSceneMouseEvent)
+        self.mouseMoveQueue.clear()
+        self._mouseMoveTimer.start()
+        self.sender().sig_startSelection.emit(MouseEventLite)
 
-    def slo_mouseRelease(self, QGraphicsSceneMouseEvent):
+    @pyqtSlot(MouseEventLite)
+    def slo_mouseRelease(self, MouseEventLite):
         """
         Triggered by a mouse release on TrackView. The signal is multiplied to all tracks and used to control the
         selection rectangles. It would also be possible to loop back the signal to only one track instead of having
         synchronised selections on all tracks.
 
-        :param QGraphicsSceneMouseEvent: Qt mouse event type containing the position on the scene, where the event was
+        :param MouseEventLite: Mouse event containing the position on the scene, where the event was
          triggered.
         """
-        self.sender().slo_endSelection(QGraphicsSceneMouseEvent)
+        # The selection has to reach the last position before it ends
+        self.processMouseMove()
+        self._mouseMoveTimer.stop()
+        self.sender().sig_endSelection.emit(MouseEventLite)
 
-    def slo_mouseMove(self, QGraphicsSceneMouseEvent):
+    def processMouseMove(self):
         """
-        Triggered by a mouse movement on TrackView. The signal is multiplied to all tracks and used to control the
-        selection rectangles. It would also be possible to loop back the signal to only one track instead of having
-        synchronised selections on all tracks.
-
-        :param QGraphicsSceneMouseEvent: Qt mouse event type containing the position on the scene, where the event was
-         triggered.
+        Triggered once per frame while a mouse button is held. Takes the latest mouse movement on TrackView from the
+        mouse move queue, older ones have already been discarded by the queue. It is used to control the selection
+        rectangles of the track it came from.
         """
-        self.sender().slo_moveSelection(QGraphicsSceneMouseEvent)
+        if self.mouseMoveQueue:
+            broker, event = self.mouseMoveQueue.pop()
+            broker.sig_moveSelection.emit(event)
 
+    @pyqtSlot()
     def slo_delete(self):
         """
         Triggered by pressing the "X"-button. Deletion is only possible when there is no backend processing active
@@ -211,18 +246,19 @@ class TrackManager(TrackAbstract):
         are deleted. Then a signal is emitted to also remove this channel from the backend.
         """
         if not self.playing and not self.recording:
-            trackData = self.trackData[self.sender()]
-            track = self.sender()
+            trackData = self.trackData[self.senderTrack()]
+            track = self.senderTrack()
             channel = trackData.channel
 
             self.tracks.remove(track)
             del self.trackData[track]
             track.setVisible(False)
             track.destroy()
-            track.sig_requestWaveform.disconnect()
-            track.sig_viewChanged.disconnect()
+            track.broker.sig_requestWaveform.disconnect()
+            track.broker.sig_viewChanged.disconnect()
             self.deleteChannel.emit(channel, track)
 
+    @pyqtSlot()
     def slo_zoomIn(self):
         """
         Triggered by pressing the "+"-button. The zoom range is limited and the steps are selected in a way that they
@@ -230,8 +266,9 @@ class TrackManager(TrackAbstract):
         """
         if self.factor < 22:
             self.factor *= 1.25
-            self.sig_redraw.emit(self.factor)
+            self.broker.sig_redraw.emit(self.factor)
 
+    @pyqtSlot()
     def slo_zoomOut(self):
         """
         Triggered by pressing the "-"-button. The zoom range is limited and the steps are selected in a way that they
@@ -239,8 +276,9 @@ class TrackManager(TrackAbstract):
         """
         if self.factor > 0.007 or True:
             self.factor *= 0.8
-            self.sig_redraw.emit(self.factor)
+            self.broker.sig_redraw.emit(self.factor)
 
+    @pyqtSlot(str, str)
     def slo_selectionChange(self, selectionName, analysisType):
         """
         Triggered when the user has made a change to one of the dropdown menus on TrackButtons. The selection areas of
@@ -260,8 +298,9 @@ class TrackManager(TrackAbstract):
 
             # Replace with stored data
             [selectionName, points, state, analysisType] = self.trackData[track].getCurrentSelection()
-            track.slo_setSelection(selectionName, analysisType, points, state)
+            track.relaySetSelection(selectionName, analysisType, points, state)
 
+    @pyqtSlot(QRectF)
     def slo_viewChanged(self, QRectF):
         """
         Triggered by any change on TrackView, e.g. by dragging or scrolling in the view widget. The changes are simply
@@ -269,12 +308,15 @@ class TrackManager(TrackAbstract):
 
         :param QRectF: Portion of the scene to display.
         """
+        sender = self.senderTrack()
         for track in self.tracks:
-            if track is not self.sender():
-                track.slo_setView(QRectF)
+            if track is not sender:
+                track.broker.sig_setView.emit(QRectF)
+        if self.overview is not sender:
             self.overview.slo_setView(QRectF)
-        self.slo_update(0.0)
+        self.broker.sig_update.emit(0.0)
 
+    @pyqtSlot(QKeyEvent)
     def slo_keyEnter(self, QKeyEvent):
         """
         Receives any keyboard press event from any area of the track. There are two inputs filtered at the moment:
@@ -288,43 +330,48 @@ class TrackManager(TrackAbstract):
         if QKeyEvent.key() == Qt.Key_M:
             self.slo_requestMark()
 
+    @pyqtSlot()
     def slo_requestMark(self):
         """
         Triggered by pressing "M" or the marker button on TrackButtons. The last position/sample (the cursor position)
         is retrieved from TrackData for the active channel and a mark is then set on this position for  all channels.
         """
-        smp = self.trackData[self.sender()].getLastPos()
+        smp = self.trackData[self.senderTrack()].getLastPos()
         for track in self.tracks:
                 self.trackData[track].setMark(smp)
-                self.slo_setMark(smp)
-                self.slo_redraw(self.factor)
+        # sig_setMark of the manager already reaches all tracks, so it is emitted once
+        if self.relaySetMark(smp):
+            self.broker.sig_redraw.emit(self.factor)
 
+    @pyqtSlot()
     def slo_skipForward(self):
         """
         Request from a TrackUI object to move the cursor the next mark in forward direction. Positions are all read from
         the corresponding TrackData object.
         """
         self.slo_playpause()
-        trackData = self.trackData[self.sender()]
+        trackData = self.trackData[self.senderTrack()]
         smp = trackData.getLastPos()
         mark = trackData.getNextMark(smp)
         trackData.setLastPos(mark)
-        self.sender().setCursor(mark)
+        self.senderTrack().setCursor(mark)
         self.slo_playpause()
 
+    @pyqtSlot()
     def slo_skipBackward(self):
         """
         Request from a TrackUI object to move the cursor the next mark in backward direction. Positions are all read
         from the corresponding TrackData object.
         """
         self.slo_playpause()
-        trackData = self.trackData[self.sender()]
+        trackData = self.trackData[self.senderTrack()]
         smp = trackData.getLastPos()
         mark = trackData.getPreviousMark(smp)
         trackData.setLastPos(mark)
-        self.sender().setCursor(mark)
+        self.senderTrack().setCursor(mark)
         self.slo_playpause()
 
+    @pyqtSlot(QKeyEvent)
     def slo_keyRelease(self, QKeyEvent):
         """
         Receives any keyboard release event from any area of the track. There is only one input filtered at the moment:
@@ -374,13 +421,17 @@ class TrackManager(TrackAbstract):
         self.tracks.append(newTrack)
         self.trackData[newTrack] = trackData
 
+        # The new track has not received any mark yet, see relaySetMark
+        self._lastMark = None
+
         for track in self.tracks:
             track.enableScrollbar(False)
         newTrack.enableScrollbar(False)
 
-        self.slo_update(0.0)
+        self.broker.sig_update.emit(0.0)
         self.addTrack.emit(newTrack)
 
+    @pyqtSlot(int, int, int)
     def slo_requestWaveform(self, startBlock, dataBlocks, numberOfPixmaps):
         """
         This is the slot used by TrackWaveform to request all needed waveforms for the current position and zoom level.
@@ -391,7 +442,7 @@ class TrackManager(TrackAbstract):
         :param widthPreScaling: The width of the requested pixmap, equalling the zoom level.
         :param height: Height of the pixmap
         """
-        channel = self.trackData[self.sender()].channel
+        channel = self.trackData[self.senderTrack()].channel
         self.getWaveform.emit(channel, startBlock, dataBlocks, numberOfPixmaps)
 
     def updateFromRecorder(self, smp):
@@ -402,7 +453,7 @@ class TrackManager(TrackAbstract):
         :param smp: Last recorded sample/position
         """
         pos = smp / self.smptopix
-        self.slo_update(pos)
+        self.broker.sig_update.emit(pos)
 
 
     def newSelection(self):
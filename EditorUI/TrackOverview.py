@@ -1,11 +1,13 @@
 from PyQt5.Qt import *
 from PyQt5.QtGui import *
 
-from EditorUI.TrackAbstract import TrackAbstract
+from EditorUI.TrackAbstract import TrackAbstract, MouseEventLite
 from EditorUI.TrackView import TrackScene
 
 class TrackOverview(TrackAbstract):
 
+    _OWNS_BROKER = True
+
     def __init__(self, name, state, selections, analysisTypes, marks, cursorposition, height, width, smptopix, zoom, parent):
         super(TrackOverview, self).__init__(name, state, selections, analysisTypes, marks, cursorposition, height, width, smptopix, zoom, parent)
 
@@ -47,23 +49,26 @@ class TrackOverview(TrackAbstract):
 
         self.factor = 1
 
+        # The overview handles mouse input on its own scene instead of relaying it to the TrackManager
+        self.broker.sig_mousePress.disconnect()
+        self.broker.sig_mouseRelease.disconnect()
+        self.broker.sig_mouseDoubleClick.disconnect()
+        self.broker.sig_mousePress.connect(self.mouseEvent, Qt.DirectConnection)
+
         self.setLayout(self.layout)
         self.show()
 
-    def slo_mousePress(self, QGraphicsSceneMouseEvent):
-        self.mouseEvent(QGraphicsSceneMouseEvent)
-
-    def slo_mouseMove(self, QGraphicsSceneMouseEvent):
-        self.mouseEvent(QGraphicsSceneMouseEvent)
+    def relayMouseMove(self, event):
+        """
+        Mouse moves on the overview are handled right away instead of being queued for the TrackManager.
 
-    def slo_mouseDoubleClick(self, QGraphicsSceneMouseEvent):
-        pass
+        :param event: MouseEventLite
+        """
+        self.mouseEvent(event)
 
-    def slo_mouseRelease(self, QGraphicsSceneMouseEvent):
-        pass
-
-    def mouseEvent(self, QGraphicsSceneMouseEvent):
-        x = QGraphicsSceneMouseEvent.scenePos().x()
+    @pyqtSlot(MouseEventLite)
+    def mouseEvent(self, MouseEventLite):
+        x = MouseEventLite.x
         x = x * (self.maxLength / self.width)
         if x < 0:
             x = 0
@@ -71,14 +76,22 @@ class TrackOverview(TrackAbstract):
             x = self.maxLength
 
         rect = QRectF((x*self.factor)/441, 0, 1000, 10)
-        self.sig_viewChanged.emit(rect)
+        # TrackManager does not send the change back to the overview, so it moves its own area
+        self.showView(rect)
+        self.relayViewChanged(rect)
 
 
+    @pyqtSlot(QRectF)
     def slo_setView(self, QRectF):
+        # The view was moved from outside, the next own change has to be emitted even if it equals the last one
+        self._lastViewChanged = None
+        self.showView(QRectF)
+
+    def showView(self, QRectF):
         x = QRectF.x() * 441
         x = x / self.factor
         self.startPos = x
-        self.updateRectangle()
+        self.schedule(self.LEVEL_PAINT, self.updateRectangle)
 
     def updateRectangle(self):
         percentage = self.displayedArea/self.maxLength
@@ -96,6 +109,7 @@ class TrackOverview(TrackAbstract):
     def updateMaxLength(self, smp):
         self.maxLength = smp
 
+    @pyqtSlot(float)
     def slo_redraw(self, factor):
         self.factor = factor
-        self.updateRectangle()
\ No newline at end of file
+        self.schedule(self.LEVEL_PAINT, self.updateRectangle)
\ No newline at end of file
@@ -16,8 +16,9 @@
 
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
+from PyQt5.Qt import *
 
-from EditorUI.TrackAbstract import TrackAbstract
+from EditorUI.TrackAbstract import TrackAbstract, MouseEventLite
 
 class TrackSelection(TrackAbstract):
 
@@ -76,53 +77,57 @@ class TrackSelection(TrackAbstract):
 
     # CONTROL SLOTS
 
-    def slo_startSelection(self, QGraphicsSceneMouseEvent):
+    @pyqtSlot(MouseEventLite)
+    def slo_startSelection(self, MouseEventLite):
         """
         Control Slot. Triggers transition from "Idle" to "Start". Determines the selection type (Add to or subtract from
         selection) by the mouse button pressed and also send the position where the user pressed.
 
-        :param QGraphicsSceneMouseEvent: Qt-type from which to get the pressed mouse button and mouse position on the scene.
+        :param MouseEventLite: Mouse event from which to get the pressed mouse button and mouse position on the scene.
         """
         type = None
-        button = QGraphicsSceneMouseEvent.button()
+        button = MouseEventLite.buttons
 
         if button == Qt.LeftButton:
             type = "Add"
-            x = QGraphicsSceneMouseEvent.buttonDownScenePos(Qt.LeftButton).x()
+            x = MouseEventLite.x
             if self.state == "Idle":
                 self.IdleToStart(x, type)
         elif button == Qt.RightButton:
             type = "Remove"
-            x = QGraphicsSceneMouseEvent.buttonDownScenePos(Qt.RightButton).x()
+            x = MouseEventLite.x
             if self.state == "Idle":
                 self.IdleToStart(x, type)
 
-    def slo_endSelection(self, QGraphicsSceneMouseEvent):
+    @pyqtSlot(MouseEventLite)
+    def slo_endSelection(self, MouseEventLite):
         """
         Control Slot. Triggers transition from "Move" to "End" or "Start" to "Idle" if no mouse movement happened since
         the button was pressed.
 
-        :param QGraphicsSceneMouseEvent: Qt-type from which to get the mouse position on the scene.
+        :param MouseEventLite: Mouse event from which to get the mouse position on the scene.
         """
-        x = QGraphicsSceneMouseEvent.scenePos().x()
+        x = MouseEventLite.x
         if self.state == "Move":
             self.MoveToEnd(x)
         if self.state == "Start":
             self.StartToIdle()
 
-    def slo_moveSelection(self, QGraphicsSceneMouseEvent):
+    @pyqtSlot(MouseEventLite)
+    def slo_moveSelection(self, MouseEventLite):
         """
         Control Slot. Trigger transition from "Move" to "Move" or "Start" to "Move".
         This models the dragging of the rectangle size.
 
-        :param QGraphicsSceneMouseEvent:
+        :param MouseEventLite: Mouse event from which to get the mouse position on the scene.
         """
-        x = QGraphicsSceneMouseEvent.scenePos().x()
+        x = MouseEventLite.x
         if self.state == "Start":
             self.StartToMove(x)
         if self.state == "Move":
             self.MoveToMove(x)
 
+    @pyqtSlot(bool)
     def slo_enableSelection(self, bool):
         """
         Control Slot. Trigger transition from "Finish" to "Idle" or "Idle" to "Finish". This transition enables the user
@@ -147,6 +152,7 @@ class TrackSelection(TrackAbstract):
         """
         return [self.points, self.state]
 
+    @pyqtSlot(str, str, dict)
     def slo_setSelection(self, selectionName, analysisType, selection):
         """
         Replace the current selection.
@@ -159,15 +165,17 @@ class TrackSelection(TrackAbstract):
         self.points = selection
         self.updateSelection()
 
+    @pyqtSlot(float)
     def slo_redraw(self, factor):
         """
-        Removes all selection rectangels and redraws them after setting the new zoom-level.
+        Removes all selection rectangels and redraws them after setting the new zoom-level. Redrawing is scheduled to
+        happen after the scene has been cleared.
 
         :param factor: The new zoom-level
         """
         self.zoom = factor
         self.areas.clear()
-        self.redrawSelection()
+        self.schedule(self.LEVEL_PAINT, self.redrawSelection)
 
     #State transitions
 
@@ -222,12 +230,14 @@ class TrackSelection(TrackAbstract):
 
     def MoveToEnd(self, x):
         """
-        State transition. Triggered by releasing the mouse button. The last provisional end point of the selection
-        becomes a definite one. Subsequently the fully defined input rectangle will be processed to intersect with
-        the existing selection rectangles and sets the machine to the "End" state.
+        State transition. Triggered by releasing the mouse button. The position of the release becomes the definite end
+        point of the selection, mouse moves are throttled and may lag behind. Subsequently the fully defined input
+        rectangle will be processed to intersect with the existing selection rectangles and sets the machine to the
+        "End" state.
 
         :param x: Last position of the end point.
         """
+        self.selectionEnd = x
         start = None
         end = None
         # Account for negative values (Selecting from right to left)
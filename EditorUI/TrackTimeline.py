@@ -100,15 +100,23 @@ class TrackTimeline(TrackAbstract):
             text = min + ":" + sec + "+" + str(msc) + "ms"
         return text
 
+    @pyqtSlot(float)
     def slo_update(self, pos):
         """
         The class treats the painting area as divided into blocks. From the given position the next three blocks in each
         direction are calculated. Then if a block has not been already painted, it will be painted. This way only the
-        visible portion of the scene has to be painted.
+        visible portion of the scene has to be painted. Painting is scheduled, see updateBlocks.
 
         :param pos: position in pixels around which to paint blocks.
         """
         self.lastPos = pos
+        self.schedule(self.LEVEL_PAINT, self.updateBlocks)
+
+    def updateBlocks(self):
+        """
+        Paints all blocks around the last position that have not been painted yet.
+        """
+        pos = self.lastPos
         forward = pos + 3 * self.width
         backward = pos - 3 * self.width
         if backward < 0:
@@ -123,6 +131,7 @@ class TrackTimeline(TrackAbstract):
             except KeyError:
                 self.paintBlock(block)
 
+    @pyqtSlot(float)
     def slo_redraw(self, factor=1):
         """
         A zoom-event will reset the object and trigger a full repaint.
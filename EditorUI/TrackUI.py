@@ -28,6 +28,8 @@ class TrackUI(TrackAbstract):
     relays the interface to its child objects.
     """
 
+    _OWNS_BROKER = True
+
     def __init__(self, name, state, selections, analysisTypes, marks, cursorposition, height, width, smptopix, zoom, parent=None):
         """
         The constructor of this class creates the child objects and stores some parameter data as member attributes.
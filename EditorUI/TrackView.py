@@ -14,7 +14,7 @@
 from PyQt5.Qt import *
 from PyQt5.QtCore import *
 
-from EditorUI.TrackAbstract import TrackAbstract
+from EditorUI.TrackAbstract import TrackAbstract, MouseEventLite
 from EditorUI.TrackTimeline import TrackTimeline
 from EditorUI.TrackCursor import TrackCursor
 from EditorUI.TrackSelection import TrackSelection
@@ -47,7 +47,7 @@ class TrackViewWidget(QGraphicsView):
 
         :param QKeyEvent: KeyEvent to relay :
         """
-        self.root.slo_keyEnter(QKeyEvent)
+        self.root.broker.sig_keyEnter.emit(QKeyEvent)
 
     def keyReleaseEvent(self, QKeyEvent):
         """
@@ -55,7 +55,7 @@ class TrackViewWidget(QGraphicsView):
 
         :param QKeyEvent: KeyEvent to relay :
         """
-        self.root.slo_keyRelease(QKeyEvent)
+        self.root.broker.sig_keyRelease.emit(QKeyEvent)
 
 
 class TrackScene(QGraphicsScene):
@@ -78,35 +78,35 @@ class TrackScene(QGraphicsScene):
 
     def mousePressEvent(self, QGraphicsSceneMouseEvent):
         """
-        Override method to grab and relay QGraphicsSceneMouseEvent to parent object.
+        Override method to grab QGraphicsSceneMouseEvent and relay it as MouseEventLite to parent object.
 
         :param QGraphicsSceneMouseEvent: MouseEvent to relay
         """
-        self.root.slo_mousePress(QGraphicsSceneMouseEvent)
+        self.root.broker.sig_mousePress.emit(MouseEventLite.fromEvent(QGraphicsSceneMouseEvent, QGraphicsSceneMouseEvent.button()))
 
     def mouseReleaseEvent(self, QGraphicsSceneMouseEvent):
         """
-        Override method to grab and relay QGraphicsSceneMouseEvent to parent object.
+        Override method to grab QGraphicsSceneMouseEvent and relay it as MouseEventLite to parent object.
 
         :param QGraphicsSceneMouseEvent: MouseEvent to relay
         """
-        self.root.slo_mouseRelease(QGraphicsSceneMouseEvent)
+        self.root.broker.sig_mouseRelease.emit(MouseEventLite.fromEvent(QGraphicsSceneMouseEvent, QGraphicsSceneMouseEvent.button()))
 
     def mouseMoveEvent(self, QGraphicsSceneMouseEvent):
         """
-        Override method to grab and relay QGraphicsSceneMouseEvent to parent object.
+        Override method to grab QGraphicsSceneMouseEvent and relay it as MouseEventLite to parent object.
 
         :param QGraphicsSceneMouseEvent: MouseEvent to relay
         """
-        self.root.slo_mouseMove(QGraphicsSceneMouseEvent)
+        self.root.relayMouseMove(MouseEventLite.fromEvent(QGraphicsSceneMouseEvent, QGraphicsSceneMouseEvent.buttons()))
 
     def mouseDoubleClickEvent(self, QGraphicsSceneMouseEvent):
         """
-        Override method to grab and relay QGraphicsSceneMouseEvent to parent object.
+        Override method to grab QGraphicsSceneMouseEvent and relay it as MouseEventLite to parent object.
 
         :param QGraphicsSceneMouseEvent: MouseEvent to relay
         """
-        self.root.slo_mouseDoubleClick(QGraphicsSceneMouseEvent)
+        self.root.broker.sig_mouseDoubleClick.emit(MouseEventLite.fromEvent(QGraphicsSceneMouseEvent, QGraphicsSceneMouseEvent.button()))
 
 
 class TrackView(TrackAbstract):
@@ -116,6 +116,8 @@ class TrackView(TrackAbstract):
     place a cursor etc.
     """
 
+    _OWNS_BROKER = True
+
     def __init__(self, name, state, selections, analysisTypes, marks, cursorposition, height, width, smptopix, zoom, parent=None):
         """
         The constructor of this class creates a QGraphicsScene, links it with a QGraphicsView and creates all objects
@@ -158,24 +160,25 @@ class TrackView(TrackAbstract):
         self.widget.setDragMode(QGraphicsView().NoDrag)
 
         self.factor = 1
+        # Zoom steps since the view widget has been moved the last time, see zoomView
+        self.pendingAdjustFactor = 1
 
+    @pyqtSlot(float)
     def slo_redraw(self, factor):
         """
-        Slightly extends the base class' slo_redraw. Child classes will draw their content scaled when the slo_redraw
-         has been triggered, but before thar happens, the scene has to be emptied.
+        Child classes will draw their content scaled when the slo_redraw has been triggered, but before thar happens,
+        the scene has to be emptied. Afterwards the signal is relayed to the child classes. Clearing the scene and
+        moving the view are scheduled, so that they happen once before and after the child classes have painted.
 
         :param factor: New zoom-level
         """
-        adjustFactor = factor / self.factor
+        self.pendingAdjustFactor *= factor / self.factor
         self.factor = factor
-        rect = self.widget.mapToScene(self.widget.viewport().geometry()).boundingRect()
-        sceneLeftCorner = rect.x()
-        rect = QRectF(sceneLeftCorner*adjustFactor,0,1000,100)
-        self.widget.ensureVisible(rect, 0, 0)
+        self.schedule(self.LEVEL_VIEWPORT, self.zoomView)
 
-        self.scene.clear()
+        self.schedule(self.LEVEL_SCENE, self.scene.clear)
 
-        super(TrackView, self).slo_redraw(factor)
+        self.broker.sig_redraw.emit(factor)
 
     def viewChanged(self):
         """
@@ -185,7 +188,7 @@ class TrackView(TrackAbstract):
         """
         if self.widget.hasFocus():
             rect = self.widget.mapToScene(self.widget.viewport().geometry()).boundingRect()
-            self.sig_viewChanged.emit(rect)
+            self.relayViewChanged(rect)
 
     def viewChangedByScrollbar(self, int):
         """
@@ -195,12 +198,55 @@ class TrackView(TrackAbstract):
         :param int: Not elefant.
         """
         rect = self.widget.mapToScene(self.widget.viewport().geometry()).boundingRect()
-        self.sig_viewChanged.emit(rect)
+        self.relayViewChanged(rect)
 
+    @pyqtSlot(QRectF)
     def slo_setView(self, QRectF):
         """
-        Display the specified portion of the scene in the view widget. Then let the base class handle further treatment
-        of the signal (avoid breaking the chain of command)
+        Display the specified portion of the scene in the view widget (scheduled, see setView). Then relay the signal
+        to the child classes (avoid breaking the chain of command)
+
+        :param QRectF: Position/rectangle to display
+        """
+        self.schedule(self.LEVEL_VIEWPORT, self.setView, QRectF)
+        # The view was moved from outside, the next own change has to be emitted even if it equals the last one
+        self._lastViewChanged = None
+        self.broker.sig_setView.emit(QRectF)
+
+    @pyqtSlot(float)
+    def slo_update(self, pos):
+        """
+        TrackManager triggers slo_update without a meaningful position. A meaningful position is extracted from the
+        displayed portion of the scene once the view widget has been moved, see updatePosition.
+
+        :param pos: Not relevant here.
+        """
+        self.schedule(self.LEVEL_MEASURE, self.updatePosition)
+
+    def updatePosition(self):
+        """
+        Extracts the position from the currently displayed portion of the scene and relays the update to all child
+        classes.
+        """
+        pos = self.widget.mapFromScene(0, 0).x() * (-1)
+        self.relayUpdate(pos)
+
+    def zoomView(self):
+        """
+        Moves the view widget to the position it displayed before zooming, scaled by all zoom steps since it has been
+        moved the last time. The position is read here and not in slo_redraw, since several redraws may be scheduled
+        before the view widget moves.
+        """
+        rect = self.widget.mapToScene(self.widget.viewport().geometry()).boundingRect()
+        sceneLeftCorner = rect.x()
+        rect = QRectF(sceneLeftCorner*self.pendingAdjustFactor,0,1000,100)
+        self.pendingAdjustFactor = 1
+        self.setView(rect)
+
+    def setView(self, QRectF):
+        """
+        Display the specified portion of the scene in the view widget. The scene is extended if the rectangle lies
+        beyond its right edge.
 
         :param QRectF: Position/rectangle to display
         """
@@ -213,18 +259,6 @@ class TrackView(TrackAbstract):
             self.widget.setSceneRect(sceneRect)
 
         self.widget.ensureVisible(QRectF, 0, 0)
-        super(TrackView, self).slo_setView(QRectF)
-
-    def slo_update(self, pos):
-        """
-        TrackManager triggers slo_update without a meaningful position. This method extracts a meaningful posiiton from
-        the currently displayed portion of the scene and leaves it to the base class to relay the signal to all child
-        classes
-
-        :param pos: Not relevant here.
-        """
-        pos = self.widget.mapFromScene(0, 0).x() * (-1)
-        super(TrackView, self).slo_update(pos)
 
     def setCursor(self, smp):
         """
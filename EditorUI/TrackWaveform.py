@@ -19,6 +19,7 @@ from PyQt5.QtCore import *
 import numpy as np
 import sys
 from EditorUI.TrackAbstract import TrackAbstract
+from EditorBackend.Waveform import Waveform
 
 
 from PyQt5.QtGui import *
@@ -62,40 +63,52 @@ class TrackWaveform(TrackAbstract):
 
         self.lastPos = 0
         self.loadedBlocks = list()
+        # Returned waveforms waiting to be placed on the scene, see slo_addWaveform
+        self.pendingWaveforms = list()
 
         self.widthPreScaling = width
         self.widthPostScaling = width
 
         self.counter = 0
 
+    @pyqtSlot(Waveform)
     def slo_addWaveform(self, waveform):
         """
-        Requested waveforms return after rendering in the backend by means of this slot. The points list itself and all
-        information needed to place the pixmap on the right spot with the right size is part of the Waveform-object.
+        Requested waveforms return after rendering in the backend by means of this slot. Placing them on the scene is
+        scheduled, so that a clearing of the scene scheduled in the same pass does not remove them again.
+
+        :param waveform: A Waveform-object containing a pixmap to place on the scene.
+        """
+        # Keep the images themselves, the WaveformBufferChannel may drop them from the waveform in the meantime
+        self.pendingWaveforms.append((waveform, waveform.images))
+        self.schedule(self.LEVEL_PAINT, self.addWaveforms)
+
+    def addWaveforms(self):
+        """
+        Places all returned waveforms on the scene.
+        """
+        waveforms = self.pendingWaveforms
+        self.pendingWaveforms = list()
+        for waveform, images in waveforms:
+            self.addWaveform(waveform, images)
+
+    def addWaveform(self, waveform, images):
+        """
+        The images painted by the WaveformThread and all information needed to place the pixmap on the right spot with
+        the right size is part of the Waveform-object.
         E.g. if a waveform took too long to render (because the user has already set a new zoom level again) it will
         simply be filtered here and not used.
         The pixmap is either rendered for exactly the requested zoom level or it will be stretched to some extent.
 
         :param waveform: A Waveform-object containing a pixmap to place on the scene.
+        :param images: The images of the waveform.
         """
         if self.getClosestWaveformZoomLevel() == waveform.dataBlocks or self.getClosestWaveformZoomLevel() == 1/waveform.numberOfPixmaps:
             if self.state == "Recording":
                 self.loadedBlocks.append([waveform.startBlock, self.getClosestWaveformZoomLevel()])
 
             for pixmapNo in range(0, waveform.numberOfPixmaps):
-                pixmap = QPixmap(1000, waveform.height)
-                pixmap.fill(Qt.transparent)
-
-                painter = QPainter()
-                painter.begin(pixmap)
-                polygon = QPolygon()
-                painter.setPen(Qt.darkBlue)
-                polygon.setPoints(waveform.pointsMax[4000*pixmapNo:4000*(pixmapNo+1)])
-                painter.drawPolyline(polygon)
-                painter.setPen(Qt.blue)
-                polygon.setPoints(waveform.pointsRMS[4000*pixmapNo:4000*(pixmapNo+1)])
-                painter.drawPolyline(polygon)
-                painter.end()
+                pixmap = QPixmap.fromImage(images[pixmapNo])
 
                 correctionFactor = self.zoom*self.getClosestWaveformZoomLevel()
                 image = pixmap.scaled(1001*correctionFactor, self.height-10, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
@@ -124,13 +137,22 @@ class TrackWaveform(TrackAbstract):
                     closest = zoomLevel
         return closest
 
+    @pyqtSlot(float)
     def slo_update(self, pos):
         """
-        Creates the requests for waveforms to the backend.
+        Creates the requests for waveforms to the backend. Requesting is scheduled to happen after the scene has been
+        cleared, since the backend immediately returns waveforms that have already been rendered. See requestWaveforms.
 
         :param pos: Position around which to render
         """
         self.lastPos = pos
+        self.schedule(self.LEVEL_PAINT, self.requestWaveforms)
+
+    def requestWaveforms(self):
+        """
+        Requests all waveforms around the last position that have not been loaded yet.
+        """
+        pos = self.lastPos
 
         # Imagine the painting area as split into 1000pix wide blocks
         # Now calculate on which block the left corner of the view is currently
@@ -158,7 +180,7 @@ class TrackWaveform(TrackAbstract):
                 zoomLevel = closestZoomLevel
                 if [startBlock, zoomLevel] not in self.loadedBlocks:
                     if not (startBlock % zoomLevel) and startBlock < 120:
-                        self.sig_requestWaveform.emit(startBlock, zoomLevel, 1)
+                        self.broker.sig_requestWaveform.emit(startBlock, zoomLevel, 1)
                         if self.state == "Playback":
                             self.loadedBlocks.append([startBlock, zoomLevel])
         else:
@@ -166,11 +188,12 @@ class TrackWaveform(TrackAbstract):
                 startBlock = waveformRequest
                 zoomLevel = closestZoomLevel
                 if [startBlock, zoomLevel] not in self.loadedBlocks:
-                    self.sig_requestWaveform.emit(startBlock, 1, 1/zoomLevel)
+                    self.broker.sig_requestWaveform.emit(startBlock, 1, 1/zoomLevel)
                     if self.state == "Playback":
                         self.loadedBlocks.append([startBlock, zoomLevel])
 
 
+    @pyqtSlot(float)
     def slo_redraw(self, factor=1):
         """
         A zoom-event will reset the object and trigger a full repaint.